@@ -4,21 +4,116 @@ import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
-from io import StringIO
 
 # Import utility modules
-from utils.data_loader import load_csv_data, validate_csv_data
+from utils.data_loader import (
+    load_csv_data,
+    normalize_dates,
+    read_csv_bytes,
+    validate_price_data,
+)
 from utils.technical_analysis import (
-    calculate_moving_average,
+    calculate_moving_averages,
     calculate_rsi,
     calculate_macd,
     calculate_bollinger_bands,
 )
-from utils.visualization import (
-    create_price_chart,
-    create_volume_chart,
-    create_indicator_chart,
-)
+from utils.visualization import create_full_dashboard
+
+
+@st.cache_resource(show_spinner=False, ttl=60)
+def _list_samples(directory):
+    """List sample CSV files once; the TTL lets newly added files show up."""
+    return tuple(sorted(f for f in os.listdir(directory) if f.endswith(".csv")))
+
+
+@st.cache_data(show_spinner=False)
+def _cached_load_csv(file_path, mtime):
+    """Load a CSV once per (path, mtime) instead of on every rerun."""
+    return load_csv_data(file_path)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _parse_uploaded_csv(file_bytes):
+    """
+    Validate and parse an uploaded CSV once per unique upload.
+
+    Returns:
+        tuple: (data, is_valid, message) - data is None if the file is invalid
+    """
+    # Parse the upload once and validate the parsed frame
+    try:
+        data = read_csv_bytes(file_bytes)
+    except Exception as e:
+        return None, False, f"Error validating CSV file: {str(e)}"
+
+    # Convert the date column to datetime and sort by it, parsing it only once
+    try:
+        data = normalize_dates(data)
+    except Exception as e:
+        return None, False, f"Date column format is invalid: {str(e)}"
+
+    is_valid, message = validate_price_data(data)
+    if not is_valid:
+        return None, is_valid, message
+
+    return data, is_valid, message
+
+
+# Indicator wrappers are keyed on the raw float32 Close bytes plus parameters,
+# so a rerun triggered by an unrelated widget reuses the previous result.
+def _close_series(close_bytes):
+    return pd.Series(np.frombuffer(close_bytes, dtype=np.float32))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _mas(close_bytes, periods):
+    averages = calculate_moving_averages(_close_series(close_bytes), periods)
+    return {period: ma.to_numpy() for period, ma in averages.items()}
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _rsi(close_bytes, period):
+    return calculate_rsi(_close_series(close_bytes), period).to_numpy()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _macd(close_bytes, fast_period, slow_period, signal_period):
+    return tuple(
+        line.to_numpy()
+        for line in calculate_macd(
+            _close_series(close_bytes),
+            fast_period=fast_period,
+            slow_period=slow_period,
+            signal_period=signal_period,
+        )
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _bbands(close_bytes, window, num_std):
+    return tuple(
+        band.to_numpy()
+        for band in calculate_bollinger_bands(
+            _close_series(close_bytes), window=window, num_std=num_std
+        )
+    )
+
+
+# The chart figure is cached on its inputs so reruns that only toggle
+# unrelated widgets skip rebuilding the Plotly traces.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _dashboard_fig(symbol, data, chart_type, ma_periods):
+    return create_full_dashboard(
+        symbol, data, chart_type=chart_type, ma_periods=list(ma_periods)
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _describe(data):
+    # Round to 2 decimal places for better display
+    return data.describe().round(2)
+
 
 # Set page configuration
 st.set_page_config(page_title="Хувьцааны Үнийн Шинжилгээ", page_icon="📈", layout="wide")
@@ -42,17 +137,26 @@ data_option = st.sidebar.radio(
 )
 
 data = None
+symbol = None
 
 if data_option == "Хувьцаа сонгох":
     # List sample files
-    sample_files = sorted([f for f in os.listdir("sample_data") if f.endswith(".csv")])
+    sample_files = _list_samples("sample_data")
     if sample_files:
         selected_sample = st.selectbox(
             "Жишээ хувьцааг сонгоно уу:", sample_files,
             format_func = lambda x: x.split(".")[0],
         )
-        data = load_csv_data(f"sample_data/{selected_sample}")
-        st.info(f"Жишээ өгөгдөл ачааллаа: {selected_sample}")
+        sample_path = f"sample_data/{selected_sample}"
+        # The cached listing may still show a file deleted since it was taken
+        try:
+            mtime = os.path.getmtime(sample_path)
+        except FileNotFoundError:
+            st.warning(f"Жишээ файл олдсонгүй: {selected_sample}")
+        else:
+            data = _cached_load_csv(sample_path, mtime)
+            symbol = selected_sample.split(".")[0]
+            st.info(f"Жишээ өгөгдөл ачааллаа: {selected_sample}")
     else:
         st.warning("Жишээ файл олдсонгүй.")
 else:
@@ -60,21 +164,9 @@ else:
     uploaded_file = st.file_uploader("CSV файл оруулна уу", type=["csv"])
 
     if uploaded_file is not None:
-        # Read the file as string
-        string_data = StringIO(uploaded_file.getvalue().decode("utf-8"))
-
-        # Validate and load the data
-        is_valid, message = validate_csv_data(string_data)
+        data, is_valid, message = _parse_uploaded_csv(uploaded_file.getvalue())
+        symbol = os.path.splitext(uploaded_file.name)[0]
         if is_valid:
-            string_data.seek(0)  # Reset file pointer
-            data = pd.read_csv(string_data)
-            # Convert date column to datetime
-            if "Date" in data.columns:
-                data["Date"] = pd.to_datetime(data["Date"])
-            elif "date" in data.columns:
-                data["Date"] = pd.to_datetime(data["date"])
-                data = data.drop("date", axis=1)
-
             st.success("Өгөгдөл амжилттай ачааллаа!")
         else:
             st.error(f"Өгөгдлийн формат буруу байна: {message}")
@@ -124,11 +216,12 @@ if data is not None:
             max_value=data["Date"].max(),
         )
 
-        # Filter data based on selected date range
-        filtered_data = data[
-            (data["Date"] >= pd.Timestamp(selected_start_date))
-            & (data["Date"] <= pd.Timestamp(selected_end_date))
-        ]
+        # Filter data based on selected date range. Dates are sorted on load,
+        # so bisect for the bounds and take a contiguous slice.
+        dates = data["Date"].to_numpy()
+        lo = dates.searchsorted(np.datetime64(selected_start_date), side="left")
+        hi = dates.searchsorted(np.datetime64(selected_end_date), side="right")
+        filtered_data = data.iloc[lo:hi]
     else:
         filtered_data = data
         st.warning("No date column found. Showing all data.")
@@ -177,76 +270,51 @@ if data is not None:
 
     # Calculate technical indicators if requested
     if "Close" in filtered_data.columns:
+        close_key = filtered_data["Close"].to_numpy(dtype=np.float32).tobytes()
+
+        # Collect indicator columns and add them to the frame in one step
+        indicators = {}
+
         # Calculate Moving Averages
         if show_ma and ma_periods:
-            for period in ma_periods:
-                filtered_data[f"MA_{period}"] = calculate_moving_average(
-                    filtered_data["Close"], period
-                )
+            for period, ma in _mas(close_key, tuple(ma_periods)).items():
+                indicators[f"MA_{period}"] = ma
 
         # Calculate RSI
         if show_rsi:
-            filtered_data["RSI"] = calculate_rsi(filtered_data["Close"], rsi_period)
+            indicators["RSI"] = _rsi(close_key, rsi_period)
 
         # Calculate MACD
         if show_macd:
             (
-                filtered_data["MACD"],
-                filtered_data["MACD_Signal"],
-                filtered_data["MACD_Histogram"],
-            ) = calculate_macd(
-                filtered_data["Close"],
-                fast_period=macd_fast,
-                slow_period=macd_slow,
-                signal_period=macd_signal,
-            )
+                indicators["MACD"],
+                indicators["MACD_Signal"],
+                indicators["MACD_Histogram"],
+            ) = _macd(close_key, macd_fast, macd_slow, macd_signal)
 
         # Calculate Bollinger Bands
         if show_bbands:
             (
-                filtered_data["BB_Upper"],
-                filtered_data["BB_Middle"],
-                filtered_data["BB_Lower"],
-            ) = calculate_bollinger_bands(
-                filtered_data["Close"], window=bbands_period, num_std=bbands_std
-            )
+                indicators["BB_Upper"],
+                indicators["BB_Middle"],
+                indicators["BB_Lower"],
+            ) = _bbands(close_key, bbands_period, bbands_std)
+
+        if indicators:
+            filtered_data = filtered_data.assign(**indicators)
 
     # Create and display charts
     st.subheader("Price Chart")
 
-    # Main price chart
+    # Price, volume, RSI and MACD panels share one date axis in a single figure
     # Note: Bollinger Bands are automatically displayed if they've been calculated
-    fig_price = create_price_chart(
-        selected_sample.split(".")[0],
+    fig = _dashboard_fig(
+        symbol,
         filtered_data,
-        chart_type=chart_type,
-        ma_periods=ma_periods if show_ma else [],
+        chart_type,
+        tuple(ma_periods) if show_ma else (),
     )
-    st.plotly_chart(fig_price, use_container_width=True)
-
-    # Display technical indicators in separate charts
-    if show_rsi:
-        st.subheader("RSI (Relative Strength Index)")
-        fig_rsi = create_indicator_chart(
-            filtered_data, "RSI", y_min=0, y_max=100, reference_levels=[30, 70]
-        )
-        st.plotly_chart(fig_rsi, use_container_width=True)
-
-    if show_macd:
-        st.subheader("MACD (Moving Average Convergence Divergence)")
-        fig_macd = create_indicator_chart(
-            filtered_data,
-            main_line="MACD",
-            secondary_line="MACD_Signal",
-            histogram="MACD_Histogram",
-        )
-        st.plotly_chart(fig_macd, use_container_width=True)
-
-    # Volume chart
-    if "Volume" in filtered_data.columns:
-        st.subheader("Volume")
-        fig_volume = create_volume_chart(filtered_data)
-        st.plotly_chart(fig_volume, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True)
 
     # Display statistics
     st.subheader("Statistics")
@@ -259,10 +327,7 @@ if data is not None:
     ]
 
     if stat_cols:
-        stats_df = filtered_data[stat_cols].describe()
-
-        # Round to 2 decimal places for better display
-        stats_df = stats_df.round(2)
+        stats_df = _describe(filtered_data[stat_cols])
 
         # Display statistics
         st.dataframe(stats_df)
@@ -0,0 +1,113 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from utils.technical_analysis import (
+    calculate_atr,
+    calculate_bollinger_bands,
+    calculate_macd,
+    calculate_moving_average,
+    calculate_moving_averages,
+    calculate_rsi,
+)
+
+
+def _prices(dtype=np.float64):
+    """Random walk with NaN gaps and a flat run, on a non-default index."""
+    rng = np.random.default_rng(0)
+    values = 20000 + np.cumsum(rng.normal(0, 50, 3000))
+    values[[100, 101, 2500]] = np.nan
+    values[1000:1060] = values[999]
+    return pd.Series(values.astype(dtype), index=range(7, 3007))
+
+
+def _wilder_rsi(close, window):
+    """Reference RSI with Wilder's smoothing, written as a plain loop."""
+    delta = close.astype(np.float64).diff().fillna(0).to_numpy()
+    gain = np.clip(delta, 0, None)
+    loss = np.clip(-delta, 0, None)
+    rsi = np.full(len(delta), np.nan)
+    avg_gain = gain[1:window + 1].mean()
+    avg_loss = loss[1:window + 1].mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi[window] = 100 - 100 / (1 + avg_gain / avg_loss)
+        for i in range(window + 1, len(delta)):
+            avg_gain = (avg_gain * (window - 1) + gain[i]) / window
+            avg_loss = (avg_loss * (window - 1) + loss[i]) / window
+            rsi[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return rsi
+
+
+class TechnicalAnalysisTest(unittest.TestCase):
+    """Compare each indicator with its pandas rolling/ewm definition."""
+
+    def assertSeriesClose(self, actual, expected, rtol):
+        np.testing.assert_allclose(
+            np.asarray(actual, dtype=np.float64),
+            np.asarray(expected, dtype=np.float64),
+            rtol=rtol,
+            equal_nan=True,
+        )
+
+    def test_moving_averages(self):
+        for dtype, rtol in [(np.float64, 1e-9), (np.float32, 1e-6)]:
+            data = _prices(dtype)
+            windows = [1, 5, 20, 200, 5000]
+            averages = calculate_moving_averages(data, windows)
+            for window in windows:
+                expected = data.rolling(window=window).mean()
+                self.assertSeriesClose(averages[window], expected, rtol)
+                self.assertSeriesClose(calculate_moving_average(data, window), expected, rtol)
+                self.assertTrue(averages[window].index.equals(data.index))
+
+    def test_flat_window_has_zero_width_bands(self):
+        data = _prices()
+        upper, middle, lower = calculate_bollinger_bands(data, window=20)
+        flat = slice(1019, 1060)
+        self.assertTrue((upper.iloc[flat] == middle.iloc[flat]).all())
+        self.assertTrue((lower.iloc[flat] == middle.iloc[flat]).all())
+
+    def test_bollinger_bands(self):
+        data = _prices()
+        for window, num_std in [(5, 1), (20, 2), (50, 4)]:
+            mean = data.rolling(window=window).mean()
+            std = data.rolling(window=window).std()
+            upper, middle, lower = calculate_bollinger_bands(data, window, num_std)
+            self.assertSeriesClose(middle, mean, 1e-9)
+            self.assertSeriesClose(upper, mean + std * num_std, 1e-9)
+            self.assertSeriesClose(lower, mean - std * num_std, 1e-9)
+
+    def test_rsi(self):
+        for dtype, rtol in [(np.float64, 1e-9), (np.float32, 1e-6)]:
+            data = _prices(dtype)
+            for window in [7, 14, 21]:
+                rsi = calculate_rsi(data, window)
+                self.assertSeriesClose(rsi, _wilder_rsi(data, window), rtol)
+
+    def test_macd(self):
+        data = _prices()
+        fast = data.ewm(span=12, adjust=False).mean()
+        slow = data.ewm(span=26, adjust=False).mean()
+        signal = (fast - slow).ewm(span=9, adjust=False).mean()
+        macd_line, signal_line, histogram = calculate_macd(data, 12, 26, 9)
+        self.assertSeriesClose(macd_line, fast - slow, 1e-9)
+        self.assertSeriesClose(signal_line, signal, 1e-9)
+        self.assertSeriesClose(histogram, fast - slow - signal, 1e-9)
+
+    def test_atr(self):
+        close = _prices()
+        high = close + 10
+        low = close - 10
+        tr = pd.DataFrame({
+            'tr1': high - low,
+            'tr2': (high - close.shift()).abs(),
+            'tr3': (low - close.shift()).abs(),
+        }).max(axis=1)
+        self.assertSeriesClose(
+            calculate_atr(high, low, close, 14), tr.rolling(window=14).mean(), 1e-9
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,86 @@
 import pandas as pd
-from io import StringIO
+from io import BytesIO, StringIO
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; use the default C parser
+    pa = None
+
+
+def _read_csv(source):
+    """
+    Read a CSV file path or buffer into a DataFrame.
+    
+    With pyarrow installed the date column is typed as a timestamp while
+    reading, so it reaches pandas as datetime64 instead of an object column
+    of Python dates. Files pyarrow rejects, such as non-ISO dates or rows
+    missing a trailing column, are re-read once with pandas' C parser and
+    their dates left for parse_dates.
+    """
+    if pa is not None:
+        convert_options = pacsv.ConvertOptions(
+            column_types={'Date': pa.timestamp('ns'), 'date': pa.timestamp('ns')}
+        )
+        try:
+            return pacsv.read_csv(source, convert_options=convert_options).to_pandas()
+        except pa.ArrowInvalid:
+            if hasattr(source, 'seek'):
+                source.seek(0)
+    return pd.read_csv(source)
+
+
+def parse_dates(values):
+    """
+    Convert a date column to datetime.
+    
+    Tries the documented YYYY-MM-DD format first, which uses pandas' fast
+    vectorized parser, and falls back to format inference otherwise.
+    
+    Args:
+        values (pandas.Series): Date values
+        
+    Returns:
+        pandas.Series: Parsed datetime values
+    """
+    try:
+        return pd.to_datetime(values, format='%Y-%m-%d', cache=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values, cache=True)
+
+
+def _date_column(df):
+    """
+    Return the name of the date column ('Date' or 'date'), or None if missing.
+    """
+    if 'Date' in df.columns:
+        return 'Date'
+    if 'date' in df.columns:
+        return 'date'
+    return None
+
+
+def normalize_dates(df):
+    """
+    Rename the date column to 'Date', convert it to datetime and sort by it.
+    
+    Args:
+        df (pandas.DataFrame): Parsed CSV data
+        
+    Returns:
+        pandas.DataFrame: DataFrame sorted by 'Date' with a fresh RangeIndex,
+                          or the input unchanged if it has no date column
+    """
+    date_col_name = _date_column(df)
+    if date_col_name is None:
+        return df
+    
+    df = df.rename(columns={date_col_name: 'Date'})
+    df = df.assign(Date=parse_dates(df['Date']))
+    
+    # Sort by date so the date range can be sliced with a binary search
+    return df.sort_values('Date', ignore_index=True)
+
 
 def validate_csv_data(file_content):
     """
@@ -16,38 +97,62 @@ def validate_csv_data(file_content):
         # Read the first few rows to validate format
         df = pd.read_csv(file_content, nrows=5)
         
-        # Check for date column (could be 'Date' or 'date')
-        date_col_found = False
-        date_col_name = None
-        
-        if 'Date' in df.columns:
-            date_col_found = True
-            date_col_name = 'Date'
-        elif 'date' in df.columns:
-            date_col_found = True
-            date_col_name = 'date'
-            
-        if not date_col_found:
-            return False, "Missing 'Date' column in the CSV file."
-        
-        # Check for required price columns
-        required_columns = ['Open', 'High', 'Low', 'Close']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        
-        if missing_columns:
-            return False, f"Missing required columns: {', '.join(missing_columns)}"
+        return validate_price_data(df)
+    
+    except Exception as e:
+        return False, f"Error validating CSV file: {str(e)}"
+
+
+def validate_price_data(df):
+    """
+    Validate if a parsed DataFrame has the columns needed for stock price data.
+    
+    Args:
+        df (pandas.DataFrame): Parsed CSV data
         
-        # Try to convert date column to datetime to make sure it's in a valid format
+    Returns:
+        tuple: (is_valid, message) - A tuple containing a boolean indicating if data is valid
+               and a message explaining the reason if invalid
+    """
+    # Check for date column (could be 'Date' or 'date')
+    date_col_name = _date_column(df)
+    
+    if date_col_name is None:
+        return False, "Missing 'Date' column in the CSV file."
+    
+    # Check for required price columns
+    required_columns = ['Open', 'High', 'Low', 'Close']
+    missing_columns = [col for col in required_columns if col not in df.columns]
+    
+    if missing_columns:
+        return False, f"Missing required columns: {', '.join(missing_columns)}"
+    
+    # Try to convert date column to datetime to make sure it's in a valid format;
+    # a column already converted by normalize_dates is not parsed again
+    if not pd.api.types.is_datetime64_any_dtype(df[date_col_name]):
         try:
-            pd.to_datetime(df[date_col_name])
+            parse_dates(df[date_col_name])
         except Exception as e:
             return False, f"Date column format is invalid: {str(e)}"
-            
-        # File is valid if we get here
-        return True, "CSV format is valid."
         
-    except Exception as e:
-        return False, f"Error validating CSV file: {str(e)}"
+    # Data is valid if we get here
+    return True, "CSV format is valid."
+
+
+def read_csv_bytes(file_bytes):
+    """
+    Parse raw CSV bytes in a single pass.
+    
+    Uses the multithreaded pyarrow reader when pyarrow is installed, which
+    also parses ISO dates while reading.
+    
+    Args:
+        file_bytes (bytes): Raw CSV file content
+        
+    Returns:
+        pandas.DataFrame: Parsed CSV data
+    """
+    return _read_csv(BytesIO(file_bytes))
 
 
 def load_csv_data(file_path):
@@ -61,21 +166,10 @@ def load_csv_data(file_path):
         pandas.DataFrame: DataFrame containing the stock price data
     """
     try:
-        # Read the CSV file
-        df = pd.read_csv(file_path)
+        # Read the CSV file, with the multithreaded pyarrow reader if available
+        df = _read_csv(file_path)
         
-        # Convert date column to datetime
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'])
-        elif 'date' in df.columns:
-            df['Date'] = pd.to_datetime(df['date'])
-            df = df.drop('date', axis=1)
-            
-        # Sort by date
-        if 'Date' in df.columns:
-            df = df.sort_values('Date')
-        
-        return df
+        return normalize_dates(df)
         
     except Exception as e:
         print(f"Error loading CSV file: {str(e)}")
@@ -1,6 +1,31 @@
 import numpy as np
 import pandas as pd
 
+
+def _float_values(data):
+    """
+    Return a Series as a float ndarray, keeping float32 input in float32.
+    """
+    dtype = np.float32 if data.dtype == np.float32 else np.float64
+    return data.to_numpy(dtype=dtype)
+
+
+def _wilder_average(x, window):
+    """
+    Wilder's smoothed average of `x[1:]`; `x[0]` is ignored.
+
+    Seeded with the mean of `x[1:window + 1]` at position `window`, then
+    updated as avg = (avg * (window - 1) + x) / window, which is
+    ewm(alpha=1/window, adjust=False). The first `window` values are NaN.
+    """
+    out = np.full(len(x), np.nan)
+    if 1 <= window < len(x):
+        seeded = x[window:].astype(np.float64)
+        seeded[0] = x[1:window + 1].mean(dtype=np.float64)
+        out[window:] = pd.Series(seeded).ewm(alpha=1.0 / window, adjust=False).mean()
+    return out
+
+
 def calculate_moving_average(data, window):
     """
     Calculate Simple Moving Average (SMA) for a given data series.
@@ -15,6 +40,42 @@ def calculate_moving_average(data, window):
     return data.rolling(window=window).mean()
 
 
+def calculate_moving_averages(data, windows):
+    """
+    Calculate Simple Moving Averages (SMA) for several windows in one pass.
+    
+    A single cumulative sum is shared by every window, so the cost does not
+    grow with the number of windows requested.
+    
+    Args:
+        data (pandas.Series): Price data
+        windows (iterable): Window sizes for the moving averages
+        
+    Returns:
+        dict: Window size -> pandas.Series of moving average values
+    """
+    values = _float_values(data)
+    n = len(values)
+    
+    # Cumulative sums with NaNs counted separately, so a missing price only
+    # blanks the windows that contain it, as with rolling().mean()
+    missing = np.isnan(values)
+    filled = np.where(missing, 0.0, values)
+    csum = np.concatenate(([0.0], np.cumsum(filled, dtype=np.float64)))
+    cmissing = np.concatenate(([0], np.cumsum(missing)))
+    
+    averages = {}
+    for window in windows:
+        ma = np.full(n, np.nan)
+        if 0 < window <= n:
+            window_sum = csum[window:] - csum[:-window]
+            has_missing = (cmissing[window:] - cmissing[:-window]) > 0
+            ma[window - 1:] = np.where(has_missing, np.nan, window_sum / window)
+        averages[window] = pd.Series(ma.astype(values.dtype, copy=False), index=data.index)
+    
+    return averages
+
+
 def calculate_rsi(data, window=14):
     """
     Calculate Relative Strength Index (RSI).
@@ -27,21 +88,20 @@ def calculate_rsi(data, window=14):
         pandas.Series: RSI values
     """
     # Calculate price changes
-    delta = data.diff()
-    
-    # Create gain (positive) and loss (negative) Series
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
+    values = _float_values(data)
+    delta = np.empty_like(values)
+    delta[:1] = np.nan
+    delta[1:] = values[1:] - values[:-1]
     
-    # Calculate average gain and loss over the specified period
-    avg_gain = gain.rolling(window=window).mean()
-    avg_loss = loss.rolling(window=window).mean()
+    # Calculate Wilder's smoothed average gain and loss; NaN changes count as zero
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = _wilder_average(gain, window)
+    avg_loss = _wilder_average(loss, window)
     
-    # Calculate the relative strength (RS)
-    rs = avg_gain / avg_loss
-    
-    # Calculate RSI
-    rsi = 100 - (100 / (1 + rs))
+    # Calculate RSI; no losses gives 100, a flat window (no change) gives NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = pd.Series(100 - (100 / (1 + avg_gain / avg_loss)), index=data.index)
     
     return rsi
 
@@ -88,7 +148,7 @@ def calculate_bollinger_bands(data, window=20, num_std=2):
         tuple: (Upper band, Middle band, Lower band)
     """
     # Calculate middle band (simple moving average)
-    middle_band = data.rolling(window=window).mean()
+    middle_band = calculate_moving_average(data, window)
     
     # Calculate standard deviation
     std = data.rolling(window=window).std()
@@ -113,18 +173,19 @@ def calculate_atr(high, low, close, window=14):
     Returns:
         pandas.Series: ATR values
     """
-    # Calculate True Range
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
+    h = _float_values(high)
+    l = _float_values(low)
+    c = _float_values(close)
+    
+    # Previous close, aligned with the current bar
+    prev_close = np.empty_like(c)
+    prev_close[:1] = np.nan
+    prev_close[1:] = c[:-1]
     
-    tr = pd.DataFrame({
-        'tr1': tr1,
-        'tr2': tr2,
-        'tr3': tr3
-    }).max(axis=1)
+    # Calculate True Range; fmax skips NaNs like DataFrame.max(axis=1)
+    tr = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
     
     # Calculate ATR
-    atr = tr.rolling(window=window).mean()
+    atr = calculate_moving_average(pd.Series(tr, index=close.index), window)
     
     return atr
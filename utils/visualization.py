@@ -3,44 +3,42 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 
-def create_price_chart(symbol,data, chart_type='Line', ma_periods=None):
+def _add_price_traces(fig, data, chart_type='Line', ma_periods=None, **subplot):
     """
-    Create a price chart with optional moving averages and Bollinger Bands.
+    Add price, Bollinger Band and moving average traces to a figure.
     
     Args:
+        fig (plotly.graph_objects.Figure): Figure to add the traces to
         data (pandas.DataFrame): DataFrame with price data
         chart_type (str): Chart type ('Line' or 'Candlestick')
         ma_periods (list): List of periods for moving averages
-        
-    Returns:
-        plotly.graph_objects.Figure: Plotly figure object
+        **subplot: Optional row/col of the subplot to draw in
     """
-    if 'Date' not in data.columns:
-        return go.Figure()
-    
-    # Create figure
-    fig = go.Figure()
+    # Plotly serializes a NumPy array faster than a Series
+    x = data['Date'].values
     
     # Add price data based on chart type
     if chart_type == 'Line':
         fig.add_trace(
             go.Scatter(
-                x=data['Date'],
+                x=x,
                 y=data['Close'],
                 name='Close Price',
                 line=dict(color='royalblue', width=2)
-            )
+            ),
+            **subplot
         )
     else:  # Candlestick
         fig.add_trace(
             go.Candlestick(
-                x=data['Date'],
+                x=x,
                 open=data['Open'],
                 high=data['High'],
                 low=data['Low'],
                 close=data['Close'],
                 name='Price'
-            )
+            ),
+            **subplot
         )
     
     # Add Bollinger Bands if available
@@ -48,33 +46,36 @@ def create_price_chart(symbol,data, chart_type='Line', ma_periods=None):
         # Add upper band
         fig.add_trace(
             go.Scatter(
-                x=data['Date'],
+                x=x,
                 y=data['BB_Upper'],
                 name='Upper Bollinger Band',
                 line=dict(color='rgba(250, 128, 114, 0.7)', width=1, dash='dot'),
-            )
+            ),
+            **subplot
         )
         
         # Add middle band (SMA)
         fig.add_trace(
             go.Scatter(
-                x=data['Date'],
+                x=x,
                 y=data['BB_Middle'],
                 name='Middle Bollinger Band',
                 line=dict(color='rgba(128, 128, 128, 0.7)', width=1, dash='dot'),
-            )
+            ),
+            **subplot
         )
         
         # Add lower band
         fig.add_trace(
             go.Scatter(
-                x=data['Date'],
+                x=x,
                 y=data['BB_Lower'],
                 name='Lower Bollinger Band',
                 line=dict(color='rgba(173, 216, 230, 0.7)', width=1, dash='dot'),
                 fill='tonexty',
                 fillcolor='rgba(173, 216, 230, 0.1)'
-            )
+            ),
+            **subplot
         )
     
     # Add Moving Averages
@@ -87,12 +88,107 @@ def create_price_chart(symbol,data, chart_type='Line', ma_periods=None):
                 color = colors[i % len(colors)]
                 fig.add_trace(
                     go.Scatter(
-                        x=data['Date'],
+                        x=x,
                         y=data[col_name],
                         name=f'{period}-day MA',
                         line=dict(color=color, width=1.5)
-                    )
+                    ),
+                    **subplot
                 )
+
+
+def _add_volume_trace(fig, data, **subplot):
+    """
+    Add volume bars to a figure.
+    
+    Args:
+        fig (plotly.graph_objects.Figure): Figure to add the trace to
+        data (pandas.DataFrame): DataFrame with volume data
+        **subplot: Optional row/col of the subplot to draw in
+    """
+    fig.add_trace(
+        go.Bar(
+            x=data['Date'].values,
+            y=data['Volume'],
+            name='Volume',
+            marker=dict(color='rgba(58, 71, 80, 0.6)')
+        ),
+        **subplot
+    )
+
+
+def _add_indicator_traces(fig, data, main_line, secondary_line=None, histogram=None,
+                          **subplot):
+    """
+    Add indicator line, secondary line and histogram traces to a figure.
+    
+    Args:
+        fig (plotly.graph_objects.Figure): Figure to add the traces to
+        data (pandas.DataFrame): DataFrame with indicator data
+        main_line (str): Column name for the main line
+        secondary_line (str, optional): Column name for the secondary line
+        histogram (str, optional): Column name for histogram data
+        **subplot: Optional row/col of the subplot to draw in
+    """
+    x = data['Date'].values
+    
+    # Add main line
+    fig.add_trace(
+        go.Scatter(
+            x=x,
+            y=data[main_line],
+            name=main_line,
+            line=dict(color='blue', width=1.5)
+        ),
+        **subplot
+    )
+    
+    # Add secondary line if provided
+    if secondary_line and secondary_line in data.columns:
+        fig.add_trace(
+            go.Scatter(
+                x=x,
+                y=data[secondary_line],
+                name=secondary_line,
+                line=dict(color='red', width=1.5)
+            ),
+            **subplot
+        )
+    
+    # Add histogram if provided
+    if histogram and histogram in data.columns:
+        colors = np.where(data[histogram].to_numpy() >= 0, 'green', 'red')
+        fig.add_trace(
+            go.Bar(
+                x=x,
+                y=data[histogram],
+                name=histogram,
+                marker=dict(color=colors)
+            ),
+            **subplot
+        )
+
+
+def create_price_chart(symbol,data, chart_type='Line', ma_periods=None):
+    """
+    Create a price chart with optional moving averages and Bollinger Bands.
+    
+    Args:
+        data (pandas.DataFrame): DataFrame with price data
+        chart_type (str): Chart type ('Line' or 'Candlestick')
+        ma_periods (list): List of periods for moving averages
+        
+    Returns:
+        plotly.graph_objects.Figure: Plotly figure object
+    """
+    if 'Date' not in data.columns:
+        return go.Figure()
+    
+    # Create figure
+    fig = go.Figure()
+    
+    # Add price, Bollinger Band and moving average traces
+    _add_price_traces(fig, data, chart_type, ma_periods)
     
     # Update layout
     fig.update_layout(
@@ -138,14 +234,7 @@ def create_volume_chart(data):
     fig = go.Figure()
     
     # Add volume bars
-    fig.add_trace(
-        go.Bar(
-            x=data['Date'],
-            y=data['Volume'],
-            name='Volume',
-            marker=dict(color='rgba(58, 71, 80, 0.6)')
-        )
-    )
+    _add_volume_trace(fig, data)
     
     # Update layout
     fig.update_layout(
@@ -189,53 +278,15 @@ def create_indicator_chart(data, main_line, secondary_line=None, histogram=None,
     # Create figure
     fig = go.Figure()
     
-    # Add main line
-    fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=data[main_line],
-            name=main_line,
-            line=dict(color='blue', width=1.5)
-        )
-    )
-    
-    # Add secondary line if provided
-    if secondary_line and secondary_line in data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=data['Date'],
-                y=data[secondary_line],
-                name=secondary_line,
-                line=dict(color='red', width=1.5)
-            )
-        )
-    
-    # Add histogram if provided
-    if histogram and histogram in data.columns:
-        colors = ['green' if val >= 0 else 'red' for val in data[histogram]]
-        fig.add_trace(
-            go.Bar(
-                x=data['Date'],
-                y=data[histogram],
-                name=histogram,
-                marker=dict(color=colors)
-            )
-        )
+    # Add main line, secondary line and histogram
+    _add_indicator_traces(fig, data, main_line, secondary_line, histogram)
     
     # Add reference levels if provided
     if reference_levels:
         for level in reference_levels:
-            fig.add_shape(
-                type="line",
-                x0=data['Date'].iloc[0],
-                y0=level,
-                x1=data['Date'].iloc[-1],
-                y1=level,
-                line=dict(
-                    color="rgba(0, 0, 0, 0.5)",
-                    width=1,
-                    dash="dash",
-                )
+            fig.add_hline(
+                y=level,
+                line=dict(color="rgba(0, 0, 0, 0.5)", width=1, dash="dash")
             )
     
     # Update layout
@@ -263,3 +314,88 @@ def create_indicator_chart(data, main_line, secondary_line=None, histogram=None,
     )
     
     return fig
+
+
+def create_full_dashboard(symbol, data, chart_type='Line', ma_periods=None):
+    """
+    Create a single figure with price, volume, RSI and MACD panels on a shared date axis.
+    
+    Panels are included when their columns are present: volume for 'Volume',
+    RSI for 'RSI' and MACD for 'MACD'. Sharing the x-axis means the date array
+    is sent to the browser once instead of once per chart.
+    
+    Args:
+        symbol (str): Symbol shown as the chart title
+        data (pandas.DataFrame): DataFrame with price and indicator data
+        chart_type (str): Chart type ('Line' or 'Candlestick')
+        ma_periods (list): List of periods for moving averages
+    
+    Returns:
+        plotly.graph_objects.Figure: Plotly figure object
+    """
+    if 'Date' not in data.columns:
+        return go.Figure()
+    
+    # Panels as (name, title, y-axis title, relative height)
+    panels = [('price', '', 'Price', 0.5)]
+    if 'Volume' in data.columns:
+        panels.append(('volume', 'Trading Volume', 'Volume', 0.15))
+    if 'RSI' in data.columns:
+        panels.append(('rsi', 'RSI', 'Value', 0.175))
+    if 'MACD' in data.columns:
+        panels.append(('macd', 'MACD and MACD_Signal', 'Value', 0.175))
+    
+    # Create figure
+    fig = make_subplots(
+        rows=len(panels),
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        row_heights=[panel[3] for panel in panels],
+        subplot_titles=[panel[1] for panel in panels]
+    )
+    
+    for row, (name, _, y_title, _) in enumerate(panels, start=1):
+        if name == 'price':
+            _add_price_traces(fig, data, chart_type, ma_periods, row=row, col=1)
+        elif name == 'volume':
+            _add_volume_trace(fig, data, row=row, col=1)
+        elif name == 'rsi':
+            _add_indicator_traces(fig, data, 'RSI', row=row, col=1)
+            fig.update_yaxes(range=[0, 100], row=row, col=1)
+            for level in [30, 70]:
+                fig.add_hline(
+                    y=level,
+                    line=dict(color="rgba(0, 0, 0, 0.5)", width=1, dash="dash"),
+                    row=row,
+                    col=1
+                )
+        elif name == 'macd':
+            _add_indicator_traces(
+                fig, data, 'MACD', 'MACD_Signal', 'MACD_Histogram', row=row, col=1
+            )
+        fig.update_yaxes(title_text=y_title, row=row, col=1)
+    
+    # Update layout
+    fig.update_layout(
+        title=symbol,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1,
+            xanchor="right",
+            x=1
+        ),
+        height=500 + 200 * (len(panels) - 1)
+    )
+    
+    fig.update_xaxes(
+        rangeslider_visible=False,
+        rangebreaks=[
+            # Hide weekends
+            dict(bounds=["sat", "mon"])
+        ]
+    )
+    fig.update_xaxes(title_text='Date', row=len(panels), col=1)
+    
+    return fig